@@ -9,34 +9,57 @@ Classes:
 Constants:
     SCREEN_WIDTH (int): Width of the game screen.
     SCREEN_HEIGHT (int): Height of the game screen.
+    PIPE_SIZE (tuple): Width and height of the pipe image.
+    BIRD_SIZE (tuple): Width and height of the bird images.
+    GROUND_WIDTH (int): Width of the ground image.
+
+Assets:
+    Loaded on first use, so the game physics can run without any image file.
     PIPE_IMAGE: Image used to represent pipes in the game.
     GROUND_IMAGE: Image used to represent the ground in the game.
     BACKGROUND_IMAGE: Image used to represent the background in the game.
     BIRD_IMAGES: List of images representing the bird's animation states.
+    BIRD_MASKS: Collision masks matching each image in BIRD_IMAGES.
+    ROT_CACHE: Pre-rotated bird images and their offsets keyed by (frame index, angle).
     SCORE_FONT: Font used to display the score on the screen.
 """
 
 import os
-import random
+import math
 import logging
+from collections import deque
+import numpy as np
 import pygame
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 SCREEN_WIDTH = 500
 SCREEN_HEIGHT = 800
 
-PIPE_IMAGE = pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', 'pipe.png')))
-GROUND_IMAGE = pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', 'base.png')))
-BACKGROUND_IMAGE = pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', 'bg.png')))
-BIRD_IMAGES = [
-    pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', 'bird1.png'))),
-    pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', 'bird2.png'))),
-    pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', 'bird3.png')))
-]
+def load_image(name):
+    """
+    Loads an image from the imgs folder at twice its size.
 
-pygame.font.init()
-SCORE_FONT = pygame.font.SysFont('arial', 50)
+    Args:
+        name (str): File name of the image inside the imgs folder.
+
+    Returns:
+        Surface: The scaled image.
+    """
+    return pygame.transform.scale2x(pygame.image.load(os.path.join('imgs', name)))
+
+# Sprite sizes as returned by load_image, known without loading the images.
+PIPE_SIZE = (104, 640)
+BIRD_SIZE = (68, 48)
+GROUND_WIDTH = 672
+
+PIPE_IMAGE = None
+GROUND_IMAGE = None
+BACKGROUND_IMAGE = None
+BIRD_IMAGES = []
+BIRD_MASKS = []
+ROT_CACHE = {}
+SCORE_FONT = None
 
 class Bird:
     """
@@ -51,6 +74,7 @@ class Bird:
         height (int): The height where the bird last jumped.
         time (int): The time since the last jump.
         image_count (int): Counter for the bird's animation state.
+        frame_idx (int): Index of the current animation frame in IMGS.
         image (Surface): The current image of the bird.
 
     Methods:
@@ -63,7 +87,14 @@ class Bird:
     IMGS = BIRD_IMAGES
     MAX_ROTATION = 25
     ROTATION_SPEED = 20
+    ROTATION_STEP = 5
     ANIMATION_TIME = 5
+    # Frame index for each value of image_count: wings up, level, down, level, up.
+    ANIM_FRAMES = (
+        (0,) * ANIMATION_TIME + (1,) * ANIMATION_TIME +
+        (2,) * ANIMATION_TIME + (1,) * ANIMATION_TIME + (0,)
+    )
+    JUMP_SPEED = -10.5
 
     def __init__(self, x, y):
         """
@@ -80,38 +111,52 @@ class Bird:
         self.height = self.y
         self.time = 0
         self.image_count = 0
-        self.image = self.IMGS[0]
-        logging.info(f"Bird initialized at position ({self.x}, {self.y}).")
+        self.frame_idx = 0
+        logger.debug("Bird initialized at position (%s, %s).", self.x, self.y)
+
+    @property
+    def image(self):
+        """
+        Returns the image of the bird's current animation frame.
+
+        Returns:
+            Surface: The current image of the bird.
+        """
+        _ensure_assets()
+        return self.IMGS[self.frame_idx]
 
     def jump(self):
         """
         Makes the bird jump upwards by adjusting its velocity.
         """
-        self.speed = -10.5
+        self.speed = self.JUMP_SPEED
         self.time = 0
         self.height = self.y
-        logging.debug("Bird jumped.")
+        logger.debug("Bird jumped.")
 
     def move(self):
         """
         Calculates and updates the bird's position based on its speed and time.
         Adjusts the bird's angle depending on its movement.
         """
-        self.time += 1
-        displacement = 1.5 * (self.time**2) + self.speed * self.time
+        # Work on locals and write each attribute back once; this runs for
+        # every bird on every frame.
+        time = self.time + 1
+        displacement = 1.5 * time * time + self.speed * time
 
         if displacement > 16:
             displacement = 16
         elif displacement < 0:
             displacement -= 2
 
-        self.y += displacement
+        y = self.y + displacement
+        self.time = time
+        self.y = y
 
-        if displacement < 0 or self.y < (self.height + 50):
+        if displacement < 0 or y < (self.height + 50):
             self.angle = max(self.angle, self.MAX_ROTATION)
-        else:
-            if self.angle > -90:
-                self.angle -= self.ROTATION_SPEED
+        elif self.angle > -90:
+            self.angle -= self.ROTATION_SPEED
 
     def draw(self, screen):
         """
@@ -119,38 +164,66 @@ class Bird:
 
         Args:
             screen (Surface): The Pygame surface where the bird will be drawn.
+
+        Returns:
+            list of Rect: The areas of the screen that were drawn.
         """
-        self.image_count += 1
-
-        if self.image_count < self.ANIMATION_TIME:
-            self.image = self.IMGS[0]
-        elif self.image_count < self.ANIMATION_TIME * 2:
-            self.image = self.IMGS[1]
-        elif self.image_count < self.ANIMATION_TIME * 3:
-            self.image = self.IMGS[2]
-        elif self.image_count < self.ANIMATION_TIME * 4:
-            self.image = self.IMGS[1]
-        elif self.image_count >= self.ANIMATION_TIME * 4 + 1:
-            self.image = self.IMGS[0]
-            self.image_count = 0
+        _ensure_assets()
+        self.frame_idx = self.ANIM_FRAMES[self.image_count]
+        self.image_count = (self.image_count + 1) % len(self.ANIM_FRAMES)
 
         if self.angle <= -80:
-            self.image = self.IMGS[1]
+            self.frame_idx = 1
             self.image_count = self.ANIMATION_TIME * 2
 
-        rotated_image = pygame.transform.rotate(self.image, self.angle)
-        image_center_pos = self.image.get_rect(topleft=(self.x, self.y)).center
-        rectangle = rotated_image.get_rect(center=image_center_pos)
-        screen.blit(rotated_image, rectangle.topleft)
+        angle = self.ROTATION_STEP * round(self.angle / self.ROTATION_STEP)
+        rotated_image, dx, dy = ROT_CACHE[(self.frame_idx, angle)]
+        # Round y half up like pygame.Rect does; blit alone would truncate it.
+        return [screen.blit(rotated_image, (self.x + dx, math.floor(self.y + 0.5) + dy))]
 
     def get_mask(self):
         """
         Returns a Pygame mask for the bird's current image.
+        Masks are precomputed once per animation frame.
 
         Returns:
             Mask: A mask of the bird's current image.
         """
-        return pygame.mask.from_surface(self.image)
+        _ensure_assets()
+        return BIRD_MASKS[self.frame_idx]
+
+def rotate_bird_images():
+    """
+    Rotates every bird image to every angle the bird can reach.
+    The angle moves in ROTATION_SPEED steps between MAX_ROTATION and just below -90.
+
+    Returns:
+        dict: Tuples of the rotated image and the offset from the bird's position
+        that keeps it centered on the unrotated image, keyed by (frame index, angle).
+    """
+    cache = {}
+    for i, image in enumerate(BIRD_IMAGES):
+        for angle in range(-90 - Bird.ROTATION_SPEED, Bird.MAX_ROTATION + 1, Bird.ROTATION_STEP):
+            rotated_image = pygame.transform.rotate(image, angle)
+            dx = image.get_width() // 2 - rotated_image.get_width() // 2
+            dy = image.get_height() // 2 - rotated_image.get_height() // 2
+            cache[(i, angle)] = (rotated_image, dx, dy)
+    return cache
+
+# Random pipe heights are drawn from NumPy in batches and handed out one at a time.
+PIPE_HEIGHT_BATCH = 1024
+_pipe_heights = []
+
+def next_pipe_height():
+    """
+    Returns a random pipe height, refilling the batch of heights when it runs out.
+
+    Returns:
+        int: A height between 50 (inclusive) and 475 (exclusive).
+    """
+    if not _pipe_heights:
+        _pipe_heights.extend(np.random.randint(50, 475, size=PIPE_HEIGHT_BATCH).tolist())
+    return _pipe_heights.pop()
 
 class Pipe:
     """
@@ -164,10 +237,16 @@ class Pipe:
         height (int): Height of the top pipe.
         top_pos (int): Y-coordinate of the top pipe.
         bottom_pos (int): Y-coordinate of the bottom pipe.
-        PIPE_TOP (Surface): Image of the top pipe (flipped vertically).
-        PIPE_BOTTOM (Surface): Image of the bottom pipe.
+        PIPE_TOP (Surface): Image of the top pipe (flipped vertically), shared by all pipes.
+        PIPE_BOTTOM (Surface): Image of the bottom pipe, shared by all pipes.
+        PIPE_TOP_HEIGHT (int): Height of the top pipe image.
+        PIPE_WIDTH (int): Width of the pipe images.
+        TOP_MASK (Mask): Precomputed collision mask of the top pipe.
+        BOTTOM_MASK (Mask): Precomputed collision mask of the bottom pipe.
         passed (bool): Whether the bird has passed this pipe.
 
+    The images and masks are set when the assets are loaded.
+
     Methods:
         set_height(): Sets the random height of the pipes and adjusts their positions.
         move(): Moves the pipe horizontally to simulate scrolling.
@@ -177,6 +256,11 @@ class Pipe:
 
     DISTANCE = 200
     SPEED = 5
+    PIPE_TOP = None
+    PIPE_BOTTOM = None
+    PIPE_WIDTH, PIPE_TOP_HEIGHT = PIPE_SIZE
+    TOP_MASK = None
+    BOTTOM_MASK = None
 
     def __init__(self, x):
         """
@@ -189,8 +273,6 @@ class Pipe:
         self.height = 0
         self.top_pos = 0
         self.bottom_pos = 0
-        self.PIPE_TOP = pygame.transform.flip(PIPE_IMAGE, False, True)
-        self.PIPE_BOTTOM = PIPE_IMAGE
         self.passed = False
         self.set_height()
 
@@ -198,8 +280,8 @@ class Pipe:
         """
         Sets the height of the pipes randomly and updates their positions.
         """
-        self.height = random.randrange(50, 475) # nosec
-        self.top_pos = self.height - self.PIPE_TOP.get_height()
+        self.height = next_pipe_height()
+        self.top_pos = self.height - self.PIPE_TOP_HEIGHT
         self.bottom_pos = self.height + self.DISTANCE
 
     def move(self):
@@ -214,14 +296,21 @@ class Pipe:
 
         Args:
             screen (Surface): The Pygame surface where the pipes will be drawn.
+
+        Returns:
+            list of Rect: The areas of the screen that were drawn.
         """
-        screen.blit(self.PIPE_TOP, (self.x, self.top_pos))
-        screen.blit(self.PIPE_BOTTOM, (self.x, self.bottom_pos))
+        _ensure_assets()
+        return [
+            screen.blit(self.PIPE_TOP, (self.x, self.top_pos)),
+            screen.blit(self.PIPE_BOTTOM, (self.x, self.bottom_pos))
+        ]
 
     def collide(self, bird):
         """
         Checks if the pipe collides with the bird.
-        Uses masks for pixel-perfect collision detection.
+        Bounding boxes are compared first, and the precomputed masks are only
+        used for pixel-perfect detection when the boxes overlap.
 
         Args:
             bird (Bird): The bird object to check for collision.
@@ -229,20 +318,27 @@ class Pipe:
         Returns:
             bool: True if there's a collision, False otherwise.
         """
+        bird_width, bird_height = BIRD_SIZE
+
+        # Both pipes span the same columns, so a bird outside them touches neither.
+        if bird.x + bird_width <= self.x or self.x + self.PIPE_WIDTH <= bird.x:
+            return False
+
         bird_mask = bird.get_mask()
-        top_mask = pygame.mask.from_surface(self.PIPE_TOP)
-        bottom_mask = pygame.mask.from_surface(self.PIPE_BOTTOM)
 
-        top_offset = (self.x - bird.x, self.top_pos - round(bird.y))
-        bottom_offset = (self.x - bird.x, self.bottom_pos - round(bird.y))
+        # Both pipes share the height of the pipe image.
+        bird_y = round(bird.y)
+        if self.top_pos - bird_height < bird_y < self.top_pos + self.PIPE_TOP_HEIGHT:
+            top_offset = (self.x - bird.x, self.top_pos - bird_y)
+            if bird_mask.overlap(self.TOP_MASK, top_offset):
+                return True
 
-        top_point = bird_mask.overlap(top_mask, top_offset)
-        bottom_point = bird_mask.overlap(bottom_mask, bottom_offset)
+        if self.bottom_pos - bird_height < bird_y < self.bottom_pos + self.PIPE_TOP_HEIGHT:
+            bottom_offset = (self.x - bird.x, self.bottom_pos - bird_y)
+            if bird_mask.overlap(self.BOTTOM_MASK, bottom_offset):
+                return True
 
-        if top_point or bottom_point:
-            return True
-        else:
-            return False
+        return False
 
 class Ground:
     """
@@ -251,7 +347,7 @@ class Ground:
     Attributes:
         SPEED (int): Speed at which the ground moves to the left.
         WIDTH (int): Width of the ground image.
-        IMAGE (Surface): Image of the ground.
+        IMAGE (Surface): Image of the ground, set when the assets are loaded.
         y (int): Vertical position of the ground.
         x1 (int): Horizontal position of the first ground segment.
         x2 (int): Horizontal position of the second ground segment.
@@ -262,8 +358,8 @@ class Ground:
     """
 
     SPEED = 5
-    WIDTH = GROUND_IMAGE.get_width()
-    IMAGE = GROUND_IMAGE
+    WIDTH = GROUND_WIDTH
+    IMAGE = None
 
     def __init__(self, y):
         """
@@ -295,31 +391,128 @@ class Ground:
 
         Args:
             screen (Surface): The Pygame surface where the ground will be drawn.
+
+        Returns:
+            list of Rect: The areas of the screen that were drawn.
         """
-        screen.blit(self.IMAGE, (self.x1, self.y))
-        screen.blit(self.IMAGE, (self.x2, self.y))
+        _ensure_assets()
+        return [
+            screen.blit(self.IMAGE, (self.x1, self.y)),
+            screen.blit(self.IMAGE, (self.x2, self.y))
+        ]
+
+def _set_images(pipe, ground, background, birds):
+    """
+    Installs the given images as the game's images, along with everything derived from them.
+
+    Args:
+        pipe (Surface): Image of the pipes.
+        ground (Surface): Image of the ground.
+        background (Surface): Image of the background.
+        birds (list of Surface): Images of the bird's animation states.
+    """
+    global PIPE_IMAGE, GROUND_IMAGE, BACKGROUND_IMAGE  # pylint: disable=global-statement
+    PIPE_IMAGE = pipe
+    GROUND_IMAGE = ground
+    BACKGROUND_IMAGE = background
+    BIRD_IMAGES[:] = birds
+
+    Pipe.PIPE_TOP = pygame.transform.flip(PIPE_IMAGE, False, True)
+    Pipe.PIPE_BOTTOM = PIPE_IMAGE
+    Ground.IMAGE = GROUND_IMAGE
+    ROT_CACHE.clear()
+    ROT_CACHE.update(rotate_bird_images())
+
+def _ensure_assets():
+    """
+    Loads the images, collision masks and font the first time they are needed.
+    """
+    global SCORE_FONT  # pylint: disable=global-statement
+    if BIRD_MASKS:
+        return
+
+    _set_images(
+        load_image('pipe.png'),
+        load_image('base.png'),
+        load_image('bg.png'),
+        [load_image('bird1.png'), load_image('bird2.png'), load_image('bird3.png')]
+    )
+    BIRD_MASKS[:] = [pygame.mask.from_surface(image) for image in BIRD_IMAGES]
+    Pipe.TOP_MASK = pygame.mask.from_surface(Pipe.PIPE_TOP)
+    Pipe.BOTTOM_MASK = pygame.mask.from_surface(Pipe.PIPE_BOTTOM)
+
+    pygame.font.init()
+    SCORE_FONT = pygame.font.SysFont('arial', 50)
+
+def init_assets():
+    """
+    Converts the images to the display's pixel format so blitting them is fast.
+    Must be called after pygame.display.set_mode.
+    """
+    _ensure_assets()
+    _set_images(
+        PIPE_IMAGE.convert_alpha(),
+        GROUND_IMAGE.convert(),
+        BACKGROUND_IMAGE.convert(),
+        [image.convert_alpha() for image in BIRD_IMAGES]
+    )
+
+# Rendered score texts keyed by score, so the font only rasterizes new scores.
+SCORE_CACHE_SIZE = 256
+_score_cache = {}
+
+def render_score(score):
+    """
+    Renders the score text, reusing the surface rendered for the same score before.
+
+    Args:
+        score (int): The score to be displayed.
+
+    Returns:
+        Surface: The rendered score text.
+    """
+    text = _score_cache.get(score)
+    if text is None:
+        _ensure_assets()
+        if len(_score_cache) >= SCORE_CACHE_SIZE:
+            _score_cache.clear()
+        text = SCORE_FONT.render(f"Score: {score}", True, (255, 255, 255))
+        _score_cache[score] = text
+    return text
+
+# Screen areas drawn during the previous frame. They are the only places where
+# the screen differs from the background, so restoring them erases the frame.
+_previous_rects = []
 
 def draw_screen(screen, birds, pipes, ground, score):
     """
     Draws all game elements on the screen.
+    Only the areas drawn in this frame or the previous one are repainted
+    from the background and updated on the display.
 
     Args:
         screen (Surface): The Pygame surface to draw on.
         birds (list of Bird): List of bird objects to be drawn.
-        pipes (list of Pipe): List of pipe objects to be drawn.
+        pipes (deque of Pipe): Pipe objects to be drawn.
         ground (Ground): The ground object to be drawn.
         score (int): The current game score to be displayed.
     """
-    screen.blit(BACKGROUND_IMAGE, (0, 0))
+    _ensure_assets()
+    for rect in _previous_rects:
+        screen.blit(BACKGROUND_IMAGE, rect, rect)
+
+    rects = []
     for bird in birds:
-        bird.draw(screen)
+        rects.extend(bird.draw(screen))
     for pipe in pipes:
-        pipe.draw(screen)
+        rects.extend(pipe.draw(screen))
 
-    text = SCORE_FONT.render(f"Score: {score}", 1, (255, 255, 255))
-    screen.blit(text, (SCREEN_WIDTH - 10 - text.get_width(), 10))
-    ground.draw(screen)
-    pygame.display.update()
+    text = render_score(score)
+    rects.append(screen.blit(text, (SCREEN_WIDTH - 10 - text.get_width(), 10)))
+    rects.extend(ground.draw(screen))
+
+    pygame.display.update(_previous_rects + rects)
+    _previous_rects[:] = rects
 
 def game_over_screen(screen, score):
     """
@@ -369,60 +562,86 @@ def show_start_screen(screen):
                 if event.key == pygame.K_SPACE:
                     return
 
-def main():
+def _noop(_event, _birds):
+    """
+    Ignores an event the game does not react to.
     """
-    The main function for running the Flappy Bird game loop.
 
-    Handles the initialization of game objects, event handling, game logic, and rendering.
+def _on_quit(_event, _birds):
+    """
+    Closes the game when the window is closed.
+    """
+    pygame.quit()
+    quit()
 
-    Workflow:
-        1. Initializes game objects like birds, ground, and pipes.
-        2. Sets up the game screen and clock for managing the frame rate.
-        3. Runs the main game loop to handle user input, object movement, collision detection, and drawing.
+def _jump_all(_event, birds):
+    """
+    Makes every bird jump.
 
-    Logging:
-        - Logs the game start and score updates.
+    Args:
+        birds (list of Bird): The birds still in the game.
+    """
+    for bird in birds:
+        bird.jump()
 
-    Game Loop:
-        - Listens for user input (e.g., spacebar to make the bird jump).
-        - Updates the position of the birds, pipes, and ground.
-        - Checks for collisions between the bird and pipes or ground.
-        - Adds new pipes and removes off-screen pipes.
-        - Draws all game elements on the screen.
+KEY_HANDLERS = {pygame.K_SPACE: _jump_all}
 
-    Restart Behavior:
-        - If a collision occurs or the bird goes off-screen, the game over screen is displayed, and the game restarts.
+def _on_keydown(event, birds):
+    """
+    Dispatches a key press to its handler in KEY_HANDLERS.
 
     Args:
-        None
+        event (Event): The key press event.
+        birds (list of Bird): The birds still in the game.
+    """
+    KEY_HANDLERS.get(event.key, _noop)(event, birds)
+
+def _on_expose(_event, _birds):
+    """
+    Marks the whole screen for repainting after the window was covered,
+    minimized or otherwise damaged, since draw_screen only updates dirty areas.
+    """
+    _previous_rects[:] = [pygame.display.get_surface().get_rect()]
+
+# Event handlers keyed by event type, looked up once per event in run_round.
+HANDLERS = {
+    pygame.QUIT: _on_quit,
+    pygame.KEYDOWN: _on_keydown,
+    pygame.VIDEOEXPOSE: _on_expose,
+    pygame.WINDOWEXPOSED: _on_expose,
+    pygame.WINDOWSHOWN: _on_expose,
+    pygame.WINDOWRESTORED: _on_expose
+}
+HANDLED_EVENTS = list(HANDLERS)
+
+def reset_state():
+    """
+    Creates the game objects for a new round.
 
     Returns:
-        None
+        tuple: The list of birds, the deque of pipes, the ground and the initial score.
     """
-    logging.info("Game started.")
-    birds = [Bird(230, 350)]
-    ground = Ground(730)
-    pipes = [Pipe(700)]
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    score = 0
-    clock = pygame.time.Clock()
+    return [Bird(230, 350)], deque([Pipe(700)]), Ground(730), 0
 
-    show_start_screen(screen)
+def run_round(screen, clock):
+    """
+    Runs the game loop for a single round, until no bird is left.
 
-    running = True
-    while running:
+    Args:
+        screen (Surface): The Pygame surface to draw on.
+        clock (Clock): The clock used to limit the frame rate.
+
+    Returns:
+        int: The score reached in the round.
+    """
+    birds, pipes, ground, score = reset_state()
+
+    while True:
         clock.tick(30)
 
         # user interaction
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-                pygame.quit()
-                quit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    for bird in birds:
-                        bird.jump()
+        for event in pygame.event.get(HANDLED_EVENTS):
+            HANDLERS.get(event.type, _noop)(event, birds)
 
         # move things
         for bird in birds:
@@ -430,34 +649,91 @@ def main():
         ground.move()
 
         add_pipe = False
-        remove_pipes = []
+        dead_birds = set()
         for pipe in pipes:
             for i, bird in enumerate(birds):
+                # A bird that already hit a pipe can neither collide again nor score.
+                if i in dead_birds:
+                    continue
                 if pipe.collide(bird):
-                    birds.pop(i)
-                    game_over_screen(screen, score)
-                    main()
+                    dead_birds.add(i)
+                    continue
                 if not pipe.passed and bird.x > pipe.x:
                     pipe.passed = True
                     add_pipe = True
             pipe.move()
-            if pipe.x + pipe.PIPE_TOP.get_width() < 0:
-                remove_pipes.append(pipe)
 
         if add_pipe:
             score += 1
-            logging.info(f"Score updated: {score}")
+            logger.info("Score updated: %d", score)
             pipes.append(Pipe(600))
-        for pipe in remove_pipes:
-            pipes.remove(pipe)
+        # Pipes are kept in spawn order, so only the leftmost ones can leave the screen.
+        while pipes and pipes[0].x + Pipe.PIPE_WIDTH < 0:
+            pipes.popleft()
 
         for i, bird in enumerate(birds):
-            if (bird.y + bird.image.get_height()) > ground.y or bird.y < 0:
-                birds.pop(i)
-                game_over_screen(screen, score)
-                main()
+            if (bird.y + BIRD_SIZE[1]) > ground.y or bird.y < 0:
+                dead_birds.add(i)
+
+        # Drop every dead bird in one pass; popping inside the loops above
+        # would skip the bird right after each removed one.
+        if dead_birds:
+            birds = [bird for i, bird in enumerate(birds) if i not in dead_birds]
+        if not birds:
+            return score
 
         draw_screen(screen, birds, pipes, ground, score)
 
+def main():
+    """
+    The main function for running the Flappy Bird game loop.
+
+    Handles the initialization of the screen and the succession of rounds.
+
+    Workflow:
+        1. Sets up the game screen and clock for managing the frame rate.
+        2. Shows the start screen and waits for the player.
+        3. Runs a round with fresh game objects until every bird is dead.
+        4. Shows the game over screen and goes back to step 2.
+
+    Logging:
+        - Logs the game start and score updates.
+
+    Game Loop:
+        - Listens for user input (e.g., spacebar to make the bird jump).
+        - Updates the position of the birds, pipes, and ground.
+        - Checks for collisions between the bird and pipes or ground.
+        - Adds new pipes and removes off-screen pipes.
+        - Draws all game elements on the screen.
+
+    Restart Behavior:
+        - Birds that collide or go off-screen are removed; once no bird is left,
+          the game over screen is displayed, and a new round starts with the
+          same screen and clock.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    logger.info("Game started.")
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    init_assets()
+    clock = pygame.time.Clock()
+
+    # Keep SDL from queueing events the game never handles, such as mouse motion.
+    # Window exposure events stay allowed so damaged areas get repainted.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(HANDLED_EVENTS)
+
+    while True:
+        show_start_screen(screen)
+        # The start screen covered the whole screen, so repaint all of it once.
+        _previous_rects[:] = [screen.get_rect()]
+        score = run_round(screen, clock)
+        game_over_screen(screen, score)
+
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     main()
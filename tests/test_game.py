@@ -4,8 +4,17 @@ Unit tests for the Flappy Bird game.
 This module includes tests for the Bird and Pipe classes to validate their functionality.
 """
 
+import os
 import unittest
-from src.flappy_bird import Bird, Pipe
+from collections import deque
+from unittest import mock
+import pygame
+from src.flappy_bird import (
+    Bird, Ground, Pipe, render_score, load_image, run_round, draw_screen, HANDLERS,
+    PIPE_SIZE, BIRD_SIZE, GROUND_WIDTH
+)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 class TestBird(unittest.TestCase):
     def setUp(self):
@@ -22,6 +31,38 @@ class TestBird(unittest.TestCase):
         self.assertEqual(self.bird.speed, -10.5)
         self.assertEqual(self.bird.time, 0)
 
+    def test_move(self):
+        """Tests if the bird rises and tilts up right after a jump."""
+        self.bird.jump()
+        self.bird.move()
+        self.assertEqual(self.bird.time, 1)
+        self.assertEqual(self.bird.y, 189)
+        self.assertEqual(self.bird.angle, self.bird.MAX_ROTATION)
+
+    def test_animation_cycle(self):
+        """Tests if drawing the bird walks through every animation frame and loops."""
+        screen = pygame.Surface((500, 800))
+        frames = []
+        for _ in range(len(Bird.ANIM_FRAMES) + 1):
+            self.bird.draw(screen)
+            frames.append(self.bird.frame_idx)
+        self.assertEqual(frames, [0] * 5 + [1] * 5 + [2] * 5 + [1] * 5 + [0, 0])
+
+    def test_draw_position(self):
+        """Tests if the rotated bird stays centered on the unrotated image at half-pixel heights."""
+        screen = pygame.Surface((500, 800))
+        self.bird.y = 294.5
+        self.bird.angle = -35
+        rect = self.bird.draw(screen)[0]
+        center = self.bird.image.get_rect(topleft=(self.bird.x, self.bird.y)).center
+        rotated = pygame.transform.rotate(self.bird.image, self.bird.angle)
+        self.assertEqual(rect.topleft, rotated.get_rect(center=center).topleft)
+
+    def test_get_mask_is_cached(self):
+        """Tests if the bird reuses the precomputed mask of its current frame."""
+        self.assertIs(self.bird.get_mask(), self.bird.get_mask())
+        self.assertEqual(self.bird.get_mask().get_size(), self.bird.image.get_size())
+
 class TestPipe(unittest.TestCase):
     def setUp(self):
         self.pipe = Pipe(300)
@@ -36,11 +77,68 @@ class TestPipe(unittest.TestCase):
         self.assertGreater(self.pipe.height, 50)
         self.assertLess(self.pipe.height, 475)
 
+    def test_set_height_varies(self):
+        """Tests if consecutive pipes get random heights within range."""
+        heights = set()
+        for _ in range(50):
+            self.pipe.set_height()
+            self.assertIsInstance(self.pipe.height, int)
+            self.assertTrue(50 <= self.pipe.height < 475)
+            heights.add(self.pipe.height)
+        self.assertGreater(len(heights), 1)
+
     def test_move(self):
         """Tests if the pipe moves correctly."""
         initial_x = self.pipe.x
         self.pipe.move()
         self.assertEqual(self.pipe.x, initial_x - self.pipe.SPEED)
 
+    def test_collide(self):
+        """Tests if the pipe only collides with birds that touch it."""
+        self.assertFalse(self.pipe.collide(Bird(0, self.pipe.height)))
+        self.assertFalse(self.pipe.collide(Bird(self.pipe.x, self.pipe.height + 50)))
+        self.assertTrue(self.pipe.collide(Bird(self.pipe.x, self.pipe.height - 30)))
+        self.assertTrue(self.pipe.collide(Bird(self.pipe.x, self.pipe.bottom_pos - 10)))
+
+class TestRenderScore(unittest.TestCase):
+    def test_render_score_is_cached(self):
+        """Tests if the score text is only rendered once per score."""
+        self.assertIs(render_score(7), render_score(7))
+        self.assertIsNot(render_score(7), render_score(8))
+
+class TestRunRound(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_collision_does_not_score(self):
+        """Tests if a bird hitting the pipe it is passing ends the round without scoring."""
+        pipe = Pipe(225)
+        bird = Bird(230, pipe.height - 30)
+        state = ([bird], deque([pipe]), Ground(730), 0)
+        with mock.patch("src.flappy_bird.reset_state", return_value=state):
+            score = run_round(None, pygame.time.Clock())
+        self.assertEqual(score, 0)
+        self.assertFalse(pipe.passed)
+
+    def test_expose_repaints_whole_screen(self):
+        """Tests if an exposed window gets fully repainted on the next frame."""
+        screen = pygame.display.set_mode((500, 800))
+        draw_screen(screen, [Bird(230, 350)], deque([Pipe(700)]), Ground(730), 0)
+        event = pygame.event.Event(pygame.WINDOWEXPOSED)
+        HANDLERS[event.type](event, [])
+        with mock.patch("pygame.display.update") as update:
+            draw_screen(screen, [Bird(230, 350)], deque([Pipe(700)]), Ground(730), 0)
+        self.assertIn(screen.get_rect(), update.call_args[0][0])
+
+class TestAssets(unittest.TestCase):
+    def test_sprite_sizes(self):
+        """Tests if the sprite sizes used before loading match the images."""
+        self.assertEqual(load_image('pipe.png').get_size(), PIPE_SIZE)
+        self.assertEqual(load_image('bird1.png').get_size(), BIRD_SIZE)
+        self.assertEqual(load_image('base.png').get_width(), GROUND_WIDTH)
+
 if __name__ == "__main__":
     unittest.main()